@@ -6,7 +6,10 @@
 from dataclasses import dataclass
 from typing import Optional
 
+from pydantic import ValidationError
+
 from sandbox.executor import ExecutionResult, run_code
+from schemas.problem import TEST_CASE_LIST_ADAPTER
 from utils.constants import HIDDEN_RATIO_MIN
 from utils.logger import get_logger
 
@@ -96,11 +99,13 @@ def _step1_structural(mini_problem: dict) -> tuple[bool, str]:
     if not isinstance(test_cases, list) or len(test_cases) == 0:
         return False, REASON_INVALID_TEST_CASES
 
-    for tc in test_cases:
-        if not isinstance(tc, dict):
-            return False, REASON_INVALID_TEST_CASES
-        if "input" not in tc or "output" not in tc:
-            return False, REASON_INVALID_TEST_CASES
+    # One pydantic-core call validates every case (dict shape, required
+    # input/output strings) in a single Rust-side loop instead of the old
+    # per-case isinstance/key checks.
+    try:
+        test_cases = TEST_CASE_LIST_ADAPTER.validate_python(test_cases)
+    except ValidationError:
+        return False, REASON_INVALID_TEST_CASES
 
     # ── Hidden ratio enforcement ──────────────────────
     # HIDDEN_RATIO_MIN = 0.30 (from spec Section 4.4)
@@ -4,9 +4,9 @@
 # Imports from: database/db.py, database/models.py, utils/constants.py, utils/logger.py
 
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from typing import Optional
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from database.models import CapabilityScore
@@ -83,13 +83,23 @@ def compute_submission_score(
 # EMA score update
 # ─────────────────────────────────────────────
 
-def _ema_update(old_score: float, submission_score: float, weight: float) -> float:
+def _ema_update(
+    old_score:        float,
+    submission_score: float,
+    weight:           float,
+    _lo: float = SCORE_MIN,
+    _hi: float = SCORE_MAX,
+    _min=min,
+    _max=max,
+) -> float:
     """
     NewScore = (1 - weight) * OldScore + weight * SubmissionScore
     Clamped to [SCORE_MIN, SCORE_MAX] = [0.0, 1.0].
+
+    The bounds and builtins are bound as defaults so the per-concept loop in
+    update_capability_scores pays no global/module lookups per call.
     """
-    new_score = (1.0 - weight) * old_score + weight * submission_score
-    return max(SCORE_MIN, min(SCORE_MAX, new_score))
+    return _max(_lo, _min(_hi, (1.0 - weight) * old_score + weight * submission_score))
 
 
 # ─────────────────────────────────────────────
@@ -127,13 +137,13 @@ def _upsert_score(student_id: str, concept: str, new_score: float, db: Session)
     )
     if record:
         record.score      = new_score
-        record.updated_at = datetime.now(timezone.utc)
+        record.updated_at = func.now()   # SQL-side timestamp — no Python datetime
     else:
+        # updated_at is filled by the DB via server_default on insert
         db.add(CapabilityScore(
             student_id=student_id,
             concept=concept,
             score=new_score,
-            updated_at=datetime.now(timezone.utc),
         ))
 
 
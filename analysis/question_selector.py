@@ -368,6 +368,7 @@ def select_next_problem(
     student_score:     Optional[float],
     difficulty_signal: str,
     db:                Session,
+    seen_ids:          Optional[set[str]] = None,
 ) -> SelectionResult:
     """
     Main entry point. Dispatches to zone-based or Gaussian selector
@@ -379,6 +380,7 @@ def select_next_problem(
         student_score:     capability score for this concept (None → use INITIAL_SCORE)
         difficulty_signal: Brain A signal — 'easier' | 'same' | 'harder'
         db:                SQLAlchemy session
+        seen_ids:          already-attempted problem_ids; fetched from DB if None
 
     Returns:
         SelectionResult with the chosen problem (or problem_id=None if bank exhausted)
@@ -389,7 +391,8 @@ def select_next_problem(
         3. If no problem in target band → fall back to band-1
     """
     score = student_score if student_score is not None else INITIAL_SCORE
-    seen_ids = _get_seen_problem_ids(student_id, db)
+    if seen_ids is None:
+        seen_ids = _get_seen_problem_ids(student_id, db)
 
     if USE_GAUSSIAN:
         return _select_gaussian(
@@ -427,6 +430,8 @@ def get_next_problem(
     3. Returns SelectionResult (or None if no problem available)
 
     This is the interface used by routes_submit.py and routes_problems.py.
+    Both callers have already fetched seen_problem_ids, so it is passed
+    through rather than re-queried inside the selector.
     """
     from analysis.capability_engine import get_capability_score
 
@@ -438,6 +443,7 @@ def get_next_problem(
         student_score=student_score,
         difficulty_signal=difficulty_signal,
         db=db,
+        seen_ids=set(seen_problem_ids),
     )
 
     # If problem_id is None, no suitable problem was found
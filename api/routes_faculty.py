@@ -107,7 +107,9 @@ def faculty_dashboard(db: Session = Depends(get_db)) -> FacultyDashboardResponse
         min_s     = round(min(scores), 4)
         max_s     = round(max(scores), 4)
         zones     = [_zone(s) for s in scores]
-        concept_stats.append(ConceptClassStatsSchema(
+        # Values are computed and rounded right here, so model_construct
+        # skips a redundant validation pass per concept row.
+        concept_stats.append(ConceptClassStatsSchema.model_construct(
             concept=concept,
             mean_score=mean_s,
             min_score=min_s,
@@ -149,7 +151,7 @@ def faculty_dashboard(db: Session = Depends(get_db)) -> FacultyDashboardResponse
         concept_count=len(concept_stats),
     )
 
-    return FacultyDashboardResponse(
+    return FacultyDashboardResponse.model_construct(
         total_students=total_students,
         active_students=active_students,
         total_submissions=total_submissions,
@@ -240,7 +242,8 @@ def faculty_class_overview(db: Session = Depends(get_db)) -> ClassOverviewRespon
         zone              = _zone(mean_s)
         in_learning_zone  = zone in (1, 2)
 
-        summaries.append(StudentSummarySchema(
+        # Trusted, already-rounded DB aggregates — skip per-row validation.
+        summaries.append(StudentSummarySchema.model_construct(
             student_id=sid,
             student_name=student.name,
             mean_score=mean_s,
@@ -260,7 +263,7 @@ def faculty_class_overview(db: Session = Depends(get_db)) -> ClassOverviewRespon
         total_students=len(summaries),
     )
 
-    return ClassOverviewResponse(
+    return ClassOverviewResponse.model_construct(
         total_students=len(summaries),
         students=summaries,
     )
@@ -36,7 +36,7 @@ def _problem_to_student_schema(problem: Problem) -> ProblemStudentSchema:
     """
     all_cases: list[dict] = json.loads(problem.test_cases)
     visible_cases = [
-        VisibleTestCaseSchema(input=tc["input"], output=tc["output"])
+        VisibleTestCaseSchema.model_construct(input=tc["input"], output=tc["output"])
         for tc in all_cases
         if not tc.get("hidden", False)
     ]
@@ -44,7 +44,7 @@ def _problem_to_student_schema(problem: Problem) -> ProblemStudentSchema:
 
     concept_tags: list[str] = json.loads(problem.concept_tags)
 
-    return ProblemStudentSchema(
+    return ProblemStudentSchema.model_construct(
         problem_id=problem.problem_id,
         title=problem.title,
         statement=problem.statement,
@@ -151,7 +151,7 @@ def get_next_adaptive_problem(
         fallback_used=result.fallback_used,
     )
 
-    return NextProblemResponse(
+    return NextProblemResponse.model_construct(
         problem=student_schema,
         selection_mode=result.selection_mode,
         band=result.band,
@@ -184,4 +184,4 @@ def get_problem_by_id(
     problem = _get_problem_or_404(problem_id, db)
     student_schema = _problem_to_student_schema(problem)
 
-    return ProblemDetailResponse(problem=student_schema)
+    return ProblemDetailResponse.model_construct(problem=student_schema)
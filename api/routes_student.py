@@ -132,13 +132,15 @@ def get_student_profile(
     zones:  list[ZoneSchema]         = []
 
     for row in cap_rows:
-        scores.append(ConceptScoreSchema(
+        # Rows come straight from trusted, already-clamped DB reads —
+        # model_construct skips re-running the 0.0–1.0 field validators.
+        scores.append(ConceptScoreSchema.model_construct(
             concept=row.concept,
             score=round(row.score, 4),
             updated_at=row.updated_at.isoformat() if row.updated_at else None,
         ))
         zone_int, zone_label = _classify_zone(row.score)
-        zones.append(ZoneSchema(
+        zones.append(ZoneSchema.model_construct(
             concept=row.concept,
             score=round(row.score, 4),
             zone=zone_int,
@@ -173,7 +175,7 @@ def get_student_profile(
         total_submissions=total_submissions,
     )
 
-    return CapabilityProfileResponse(
+    return CapabilityProfileResponse.model_construct(
         student_id=student_id,
         student_name=student.name,
         total_submissions=total_submissions,
@@ -249,7 +251,7 @@ def get_student_history(
 
     items: list[SubmissionHistoryItem] = []
     for row in rows:
-        items.append(SubmissionHistoryItem(
+        items.append(SubmissionHistoryItem.model_construct(
             submission_id=row.submission_id,
             problem_id=row.problem_id,
             problem_title=problem_title_map.get(row.problem_id),
@@ -268,7 +270,7 @@ def get_student_history(
         total=total,
     )
 
-    return SubmissionHistoryResponse(
+    return SubmissionHistoryResponse.model_construct(
         student_id=student_id,
         total=total,
         submissions=items,
@@ -5,10 +5,11 @@
 
 import json
 import uuid
-from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from ai.brain_a import BrainAInput, BrainAOutput, get_feedback
@@ -20,9 +21,15 @@ from analysis.feature_extractor import extract_features
 from analysis.question_selector import SelectionResult, get_next_problem
 from database.db import get_db
 from database.models import Problem, Student, Submission
-from sandbox.anti_gaming import AntiGamingResult, check_anti_gaming
+from sandbox.anti_gaming import (
+    AntiGamingResult,
+    check_anti_gaming,
+    check_anti_gaming_post,
+    hash_code,
+)
 from sandbox.executor import ExecutionResult, run_code
 from schemas.problem import ProblemStudentSchema, VisibleTestCaseSchema
+from utils.constants import HIDDEN_RATIO_MIN
 from schemas.submission import (
     CapabilityUpdateSchema,
     CooldownResponse,
@@ -38,6 +45,61 @@ from utils.logger import get_logger
 router = APIRouter(tags=["submit"])
 log    = get_logger("api.routes_submit")
 
+# Difficulty label → difficulty_score mapping for Brain B problems.
+# Built once at import — frozen so the hot path never rebuilds or mutates it.
+_DIFF_SCORE = MappingProxyType({"easy": 0.25, "medium": 0.55, "hard": 0.80})
+
+# Brain B problems never carry prerequisites — serialize the empty list once.
+_EMPTY_JSON_LIST = "[]"
+
+# Per-student seen-problem cache. Warm repeat submissions skip the distinct
+# submissions scan entirely; a miss falls back to SQL. Process-local, like the
+# anti-gaming cooldown store — resets on restart, which only costs one requery.
+_seen_cache: dict[str, set[str]] = {}
+_SEEN_CACHE_MAX = 1024
+
+# Parsed test-case cache. Problem rows are immutable once stored, so the JSON
+# decode of Problem.test_cases only needs to happen once per problem per process.
+_test_case_cache: dict[str, list[dict]] = {}
+_TEST_CASE_CACHE_MAX = 2048
+
+# Compact separators — test_cases/concept_tags are machine-read only, so the
+# default ", " padding is wasted TEXT bytes on every page read.
+_JSON_COMPACT = (",", ":")
+
+# One encoder instance shared by every serialization site in this module —
+# json.dumps builds a fresh JSONEncoder and re-validates its arguments per
+# call; binding .encode once skips both.
+_encode_json = json.JSONEncoder(separators=_JSON_COMPACT, check_circular=False).encode
+
+
+def _load_test_cases(problem: Problem) -> list[dict]:
+    """Returns the parsed test-case list for a problem, cached per process."""
+    cases = _test_case_cache.get(problem.problem_id)
+    if cases is None:
+        cases = json.loads(problem.test_cases)
+        if len(_test_case_cache) >= _TEST_CASE_CACHE_MAX:
+            _test_case_cache.clear()
+        _test_case_cache[problem.problem_id] = cases
+    return cases
+
+
+def _get_seen_ids(student_id: str, db: Session) -> set[str]:
+    """Returns the cached seen-problem set for the student, querying on miss."""
+    seen = _seen_cache.get(student_id)
+    if seen is None:
+        seen = {
+            row.problem_id
+            for row in db.query(Submission.problem_id)
+                         .filter(Submission.student_id == student_id)
+                         .distinct()
+                         .all()
+        }
+        if len(_seen_cache) >= _SEEN_CACHE_MAX:
+            _seen_cache.clear()
+        _seen_cache[student_id] = seen
+    return seen
+
 
 # ─────────────────────────────────────────────
 # Helpers
@@ -67,27 +129,38 @@ def _build_visible_results(
 ) -> list[TestCaseResult]:
     """Returns test case results for visible (non-hidden) test cases only."""
     visible = [tc for tc in all_cases if not tc.get("hidden", False)]
-    results = []
-    for i, tc in enumerate(visible):
-        got    = exec_result.test_outputs[i] if i < len(exec_result.test_outputs) else ""
-        passed = exec_result.test_results[i] if i < len(exec_result.test_results) else False
-        results.append(TestCaseResult(
+
+    # Pad once instead of bounds-checking every index in the loop.
+    outputs = exec_result.test_outputs
+    passes  = exec_result.test_results
+    if len(outputs) < len(visible):
+        outputs = outputs + [""] * (len(visible) - len(outputs))
+    if len(passes) < len(visible):
+        passes = passes + [False] * (len(visible) - len(passes))
+
+    # model_construct skips pydantic validation — all fields are already the
+    # right types here, and per-field validator dispatch dominates for small models.
+    construct = TestCaseResult.model_construct
+    return [
+        construct(
             input=tc["input"],
             expected=tc["output"],
-            got=got,
-            passed=passed,
-        ))
-    return results
+            got=outputs[i],
+            passed=passes[i],
+        )
+        for i, tc in enumerate(visible)
+    ]
 
 
 def _store_problem_from_brain_b(
-    mini_problem: dict,
-    concept:      str,
-    db:           Session,
+    mini_problem:   dict,
+    concept:        str,
+    pending_writes: dict,
 ) -> Optional[str]:
     """
-    Validates and stores a Brain B generated mini_problem into the problem bank.
-    Returns problem_id if stored, None if validation fails.
+    Validates a Brain B generated mini_problem and queues it for the batched
+    insert at the end of the pipeline (see _flush_pending_writes).
+    Returns problem_id if queued, None if validation fails.
     NEVER stores unvalidated problems.
     """
     is_valid, reason = validate_problem(mini_problem)
@@ -105,31 +178,38 @@ def _store_problem_from_brain_b(
     n_hidden   = sum(1 for tc in test_cases if tc.get("hidden", False))
     ratio      = n_hidden / total if total > 0 else 0.0
 
-    # Map difficulty to difficulty_score
-    _diff_score = {"easy": 0.25, "medium": 0.55, "hard": 0.80}
-    difficulty  = mini_problem.get("difficulty", "easy").lower()
+    # Enforced here rather than via a before_insert event — keeps the check on
+    # the one code path that can produce low ratios and off every other insert.
+    if ratio < HIDDEN_RATIO_MIN:
+        log.warning(
+            "brain_b_problem_rejected",
+            reason="insufficient_hidden",
+            concept=concept,
+            hidden_ratio=round(ratio, 3),
+        )
+        return None
+
+    difficulty = mini_problem.get("difficulty", "easy").lower()
 
-    new_problem = Problem(
+    pending_writes.setdefault(Problem.__table__, []).append(dict(
         problem_id=problem_id,
         title=f"Practice: {mini_problem['statement'][:50]}",
         statement=mini_problem["statement"],
-        concept_tags=json.dumps(mini_problem.get("concept_tags", [concept])),
+        concept_tags=_encode_json(mini_problem.get("concept_tags", [concept])),
         primary_concept=concept,
         difficulty=difficulty,
-        difficulty_score=_diff_score.get(difficulty, 0.25),
-        prerequisite_concepts=json.dumps([]),
-        test_cases=json.dumps(test_cases),
+        difficulty_score=_DIFF_SCORE.get(difficulty, 0.25),
+        prerequisite_concepts=_EMPTY_JSON_LIST,
+        test_cases=_encode_json(test_cases),
         hidden_ratio=round(ratio, 3),
         expected_complexity=None,
         created_by="brain_b",
         validated=True,
         faculty_reviewed=False,
-    )
-    db.add(new_problem)
-    db.flush()
+    ))
 
     log.info(
-        "brain_b_problem_stored",
+        "brain_b_problem_queued",
         problem_id=problem_id,
         concept=concept,
         difficulty=difficulty,
@@ -143,17 +223,10 @@ def _build_next_problem_schema(
     db:         Session,
 ) -> Optional[NextProblemSchema]:
     """Selects next problem for student and returns lightweight schema."""
-    seen_ids = [
-        row.problem_id
-        for row in db.query(Submission.problem_id)
-                     .filter(Submission.student_id == student_id)
-                     .distinct()
-                     .all()
-    ]
     result: Optional[SelectionResult] = get_next_problem(
         student_id=student_id,
         concept=concept,
-        seen_problem_ids=seen_ids,
+        seen_problem_ids=_get_seen_ids(student_id, db),
         db=db,
     )
     if result is None or result.problem_id is None:
@@ -164,7 +237,7 @@ def _build_next_problem_schema(
         return None
 
     concept_tags: list[str] = json.loads(problem.concept_tags)
-    return NextProblemSchema(
+    return NextProblemSchema.model_construct(
         problem_id=problem.problem_id,
         title=problem.title,
         statement=problem.statement,
@@ -206,6 +279,9 @@ def submit_code(
         → Return SubmitResponse
     """
     submission_id = str(uuid.uuid4())
+    # Rows produced by the pipeline (Brain-B Problem, Submission) accumulate
+    # here and are written in one batched pass before next-problem selection.
+    pending_writes: dict = {}
     log.info(
         "submit_start",
         submission_id=submission_id,
@@ -216,7 +292,7 @@ def submit_code(
     # ── Step 1: Validate student + problem ───────────────────────────────────
     student = _get_student_or_404(body.student_id, db)
     problem = _get_problem_or_404(body.problem_id, db)
-    all_cases: list[dict] = json.loads(problem.test_cases)
+    all_cases: list[dict] = _load_test_cases(problem)
 
     # ── Step 2: Anti-gaming rapid-resubmit check (BEFORE execution) ──────────
     gaming_pre: AntiGamingResult = check_anti_gaming(
@@ -247,10 +323,8 @@ def submit_code(
     )
 
     # ── Step 4: Post-execution anti-gaming (hardcoding detection) ────────────
-    gaming_post: AntiGamingResult = check_anti_gaming(
-        student_id=body.student_id,
-        current_code=body.code,
-        db=db,
+    # Pure pass-rate analysis — the single DB read happened in Step 2.
+    gaming_post: AntiGamingResult = check_anti_gaming_post(
         visible_pass_rate=exec_result.visible_pass_rate,
         hidden_pass_rate=exec_result.hidden_pass_rate,
     )
@@ -347,11 +421,11 @@ def submit_code(
             _store_problem_from_brain_b(
                 mini_problem=brain_b_out.mini_problem,
                 concept=problem.primary_concept,
-                db=db,
+                pending_writes=pending_writes,
             )
             stored_mini_problem = brain_b_out.mini_problem
 
-        deep_explanation = DeepExplanationSchema(
+        deep_explanation = DeepExplanationSchema.model_construct(
             explanation=brain_b_out.explanation,
             step_by_step=brain_b_out.step_by_step,
             alternative_approach=brain_b_out.alternative_approach,
@@ -371,7 +445,7 @@ def submit_code(
     )
 
     # ── Step 10: Select next problem ─────────────────────────────────────────
-    # Flush current submission first so seen_ids includes this problem
+    # Write current submission first so seen_ids includes this problem
     _persist_submission(
         submission_id=submission_id,
         student_id=body.student_id,
@@ -384,8 +458,14 @@ def submit_code(
         brain_b_out=brain_b_out,
         escalation=escalation,
         gaming=gaming_post,
-        db=db,
+        pending_writes=pending_writes,
     )
+    _flush_pending_writes(pending_writes, db)
+
+    # Keep the seen-problem cache current so a warm hit includes this attempt.
+    cached_seen = _seen_cache.get(body.student_id)
+    if cached_seen is not None:
+        cached_seen.add(body.problem_id)
 
     next_problem = _build_next_problem_schema(
         student_id=body.student_id,
@@ -393,7 +473,8 @@ def submit_code(
         db=db,
     )
 
-    db.commit()
+    # No commit here — get_db commits once when the route returns, so the
+    # whole submit pipeline lands in a single transaction (one fsync).
 
     log.info(
         "submit_complete",
@@ -408,18 +489,18 @@ def submit_code(
     # ── Build response ────────────────────────────────────────────────────────
     visible_results = _build_visible_results(all_cases, exec_result)
 
-    return SubmitResponse(
+    return SubmitResponse.model_construct(
         submission_id=submission_id,
         pass_rate=round(effective_pass_rate, 4),
         visible_results=visible_results,
-        feedback=FeedbackSchema(
+        feedback=FeedbackSchema.model_construct(
             text=brain_a_out.feedback_text,
             mistake_category=brain_a_out.mistake_category,
             difficulty_signal=brain_a_out.difficulty_signal,
         ),
         deep_explanation=deep_explanation,
         next_problem=next_problem,
-        capability_update=CapabilityUpdateSchema(
+        capability_update=CapabilityUpdateSchema.model_construct(
             concept=cap_update.concept,
             old_score=round(cap_update.old_score, 4),
             new_score=round(cap_update.new_score, 4),
@@ -445,10 +526,10 @@ def _persist_submission(
     brain_b_out:        Optional[BrainBOutput],
     escalation:         EscalationResult,
     gaming:             AntiGamingResult,
-    db:                 Session,
+    pending_writes:     dict,
 ) -> None:
-    """Persists the Submission ORM row. Called before next-problem selection."""
-    brain_a_json = json.dumps({
+    """Queues the Submission row for the batched insert (see _flush_pending_writes)."""
+    brain_a_json = _encode_json({
         "feedback_text":      brain_a_out.feedback_text,
         "mistake_category":   brain_a_out.mistake_category,
         "difficulty_signal":  brain_a_out.difficulty_signal,
@@ -456,18 +537,20 @@ def _persist_submission(
 
     brain_b_json = None
     if brain_b_out is not None:
-        brain_b_json = json.dumps({
+        brain_b_json = _encode_json({
             "explanation":          brain_b_out.explanation,
             "step_by_step":         brain_b_out.step_by_step,
             "alternative_approach": brain_b_out.alternative_approach,
             "has_mini_problem":     brain_b_out.mini_problem is not None,
         })
 
-    row = Submission(
+    # submitted_at is filled by the DB (server_default) — no Python datetime.
+    pending_writes.setdefault(Submission.__table__, []).append(dict(
         submission_id=submission_id,
         student_id=student_id,
         problem_id=problem_id,
         code=code,
+        code_hash=hash_code(code),
         pass_rate=round(effective_pass_rate, 4),
         visible_pass_rate=round(exec_result.visible_pass_rate, 4),
         hidden_pass_rate=round(exec_result.hidden_pass_rate, 4) if exec_result.hidden_pass_rate is not None else None,
@@ -479,7 +562,14 @@ def _persist_submission(
         escalation_reason=escalation.reason,
         gaming_flagged=gaming.flagged,
         gaming_reason=gaming.reason,
-        submitted_at=datetime.now(timezone.utc),
-    )
-    db.add(row)
-    db.flush()   # flush so problem_id appears in seen_ids for next-problem query
+    ))
+
+
+def _flush_pending_writes(pending_writes: dict, db: Session) -> None:
+    """
+    Executes all queued pipeline inserts — one executemany per table, so
+    statement preparation is amortized across the Problem + Submission rows
+    instead of each paying its own round-trip.
+    """
+    for table, rows in pending_writes.items():
+        db.execute(insert(table), rows)
@@ -4,14 +4,16 @@
 # All other modules obtain a DB session via get_db() or SessionLocal().
 
 import os
+import threading
 from contextlib import contextmanager
 from typing import Generator
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, event, text
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.orm import Session, sessionmaker
 
 from database.models import Base
+from utils.constants import SCHEMA_VERSION
 from utils.logger import get_logger
 
 load_dotenv()
@@ -36,6 +38,9 @@ engine = create_engine(
 # ─────────────────────────────────────────────
 # Enable WAL mode + foreign keys for every new SQLite connection.
 # WAL = Write-Ahead Logging — allows concurrent reads during writes.
+# synchronous=NORMAL skips the per-commit fsync of the WAL file; with WAL
+# this risks losing only the last transactions on power loss, never
+# corruption — the right trade for submit-latency on a classroom server.
 # Foreign key enforcement is OFF by default in SQLite; must be set per-connection.
 # ─────────────────────────────────────────────
 
@@ -43,6 +48,7 @@ engine = create_engine(
 def _on_connect(dbapi_connection, connection_record) -> None:
     cursor = dbapi_connection.cursor()
     cursor.execute("PRAGMA journal_mode=WAL;")
+    cursor.execute("PRAGMA synchronous=NORMAL;")
     cursor.execute("PRAGMA foreign_keys=ON;")
     cursor.close()
 
@@ -98,40 +104,112 @@ def db_session() -> Generator[Session, None, None]:
         db.close()
 
 
+# ─────────────────────────────────────────────
+# Schema sentinel — one metadata read replaces per-table introspection
+# on warm boots. schema_meta is a bare key/value table managed with raw
+# SQL so it exists before any ORM metadata does.
+# ─────────────────────────────────────────────
+
+def _meta_get(key: str):
+    with engine.connect() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE IF NOT EXISTS schema_meta "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        row = conn.exec_driver_sql(
+            "SELECT value FROM schema_meta WHERE key = ?", (key,)
+        ).fetchone()
+        conn.commit()
+    return row[0] if row else None
+
+
+def _meta_set(key: str, value: str) -> None:
+    with engine.connect() as conn:
+        conn.exec_driver_sql(
+            "INSERT OR REPLACE INTO schema_meta (key, value) VALUES (?, ?)",
+            (key, value),
+        )
+        conn.commit()
+
+
 # ─────────────────────────────────────────────
 # Table initialisation — called once on startup
 # ─────────────────────────────────────────────
 
+def _guard_legacy_database() -> None:
+    """
+    Refuses to adopt a database created before schema versioning existed.
+    create_all silently skips tables that already exist, so stamping such a
+    database as SCHEMA_VERSION-current would mask every column it is
+    missing (code_hash, timestamp defaults, …) and break writes at runtime
+    instead of at boot. Fail loudly with a recovery instruction.
+    """
+    if inspect(engine).has_table("students"):
+        log.error("db_schema_legacy", database_url=DATABASE_URL)
+        raise RuntimeError(
+            f"Database at {DATABASE_URL} has tables but no schema_version "
+            "sentinel — it predates the current schema, and create_all "
+            "cannot alter existing tables. Delete the database file (it is "
+            "recreated and reseeded on next boot) or migrate it manually."
+        )
+
+
 def init_db() -> None:
     """
-    Creates all tables that do not yet exist.
-    Safe to call on every startup — SQLAlchemy uses CREATE TABLE IF NOT EXISTS.
-    After table creation, runs the seeder if the problems table is empty.
+    Creates all tables that do not yet exist, gated on a schema_meta
+    sentinel: a warm boot on the current SCHEMA_VERSION costs one metadata
+    SELECT instead of a PRAGMA table_info round per table. Bumping
+    SCHEMA_VERSION in utils/constants.py forces create_all to run again.
+    A populated database with no sentinel at all is rejected outright —
+    see _guard_legacy_database. After table creation, runs the seeder
+    (also sentinel-gated).
     """
     log.info("db_init_start", database_url=DATABASE_URL)
     try:
-        Base.metadata.create_all(bind=engine)
-        log.info("db_tables_created")
+        stamped = _meta_get("schema_version")
+        if stamped == SCHEMA_VERSION:
+            log.info("db_schema_current", version=SCHEMA_VERSION)
+        else:
+            if stamped is None:
+                _guard_legacy_database()
+            Base.metadata.create_all(bind=engine)
+            _meta_set("schema_version", SCHEMA_VERSION)
+            log.info("db_tables_created", version=SCHEMA_VERSION)
         _maybe_seed()
     except Exception as exc:
         log.exception("db_init_failed", error=str(exc))
         raise
 
 
+# Serializes seed attempts within this process — a second init_db call while
+# the first seed is still inserting waits instead of racing it.
+_seed_lock = threading.Lock()
+
+
 def _maybe_seed() -> None:
     """
-    Imports and runs the seeder only if the problems table is empty.
-    Deferred import avoids a circular dependency at module load time.
+    Runs the seeder on a daemon thread so first boot starts serving before
+    the insert lands; the seed is tiny, so the window where /problems is
+    still empty is milliseconds. A schema_meta 'seeded' sentinel skips the
+    whole insert on warm boots; seed_problems itself stays idempotent
+    (INSERT OR IGNORE), so a crash between seeding and sentinel write just
+    means one harmless re-run. Deferred import avoids a circular dependency
+    at load time.
     """
-    with db_session() as db:
-        count = db.execute(text("SELECT COUNT(*) FROM problems")).scalar()
-        if count == 0:
-            log.info("db_seed_start", reason="problems_table_empty")
-            from database.seed import seed_problems
-            seed_problems(db)
-            log.info("db_seed_complete")
-        else:
-            log.info("db_seed_skipped", existing_problems=count)
+    def _run() -> None:
+        with _seed_lock:
+            try:
+                if _meta_get("seeded") == "1":
+                    log.info("db_seed_skipped")
+                    return
+                with db_session() as db:
+                    from database.seed import seed_problems
+                    seed_problems(db)
+                _meta_set("seeded", "1")
+            except Exception as exc:
+                log.exception("db_seed_failed", error=str(exc))
+
+    threading.Thread(target=_run, name="adaptlab-seed", daemon=True).start()
 
 
 # ─────────────────────────────────────────────
@@ -3,10 +3,13 @@
 # Registers all routers. Runs DB init + seed on startup.
 # Imports from: api/routes_*.py, database/db.py, utils/logger.py
 
+import hashlib
+import json
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from api.routes_faculty import router as faculty_router
 from api.routes_problems import router as problems_router
@@ -59,6 +62,7 @@ app = FastAPI(
     ),
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,   # Rust-side JSON encoding app-wide
 )
 
 
@@ -89,21 +93,40 @@ app.include_router(faculty_router)      # GET  /faculty/dashboard, /faculty/clas
 
 # ─────────────────────────────────────────────
 # Health check
+# Both bodies are constants, so they are serialized once at import and
+# served as raw bytes with an ETag — a load balancer probing every second
+# pays a header compare instead of dict allocation + JSON encoding.
 # ─────────────────────────────────────────────
 
+def _static_json(payload: dict) -> tuple[bytes, str]:
+    body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    etag = hashlib.md5(body, usedforsecurity=False).hexdigest()
+    return body, etag
+
+
+_HEALTH_BYTES, _HEALTH_ETAG = _static_json(
+    {"status": "ok", "service": "AdaptLab", "version": "1.0.0"}
+)
+_ROOT_BYTES, _ROOT_ETAG = _static_json(
+    {"service": "AdaptLab", "docs": "/docs", "health": "/health"}
+)
+
+
+def _static_response(request: Request, body: bytes, etag: str) -> Response:
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    return Response(body, media_type="application/json", headers={"etag": etag})
+
+
 @app.get("/health", tags=["system"], summary="Health check")
-def health_check() -> dict:
+def health_check(request: Request) -> Response:
     """Returns service status. Used by load balancer / monitoring."""
-    return {"status": "ok", "service": "AdaptLab", "version": "1.0.0"}
+    return _static_response(request, _HEALTH_BYTES, _HEALTH_ETAG)
 
 
 @app.get("/", tags=["system"], include_in_schema=False)
-def root() -> dict:
-    return {
-        "service": "AdaptLab",
-        "docs":    "/docs",
-        "health":  "/health",
-    }
+def root(request: Request) -> Response:
+    return _static_response(request, _ROOT_BYTES, _ROOT_ETAG)
 
 
 # ─────────────────────────────────────────────
@@ -115,10 +138,16 @@ if __name__ == "__main__":
     from utils.constants import SERVER_HOST, SERVER_PORT
 
     log.info("starting_dev_server", host=SERVER_HOST, port=SERVER_PORT)
+    # loop/http select the C implementations shipped with uvicorn[standard]:
+    # uvloop for the event loop, llhttp (httptools) for HTTP parsing.
+    # Single worker only — cooldowns and the execution cache live in-process.
     uvicorn.run(
         "main:app",
         host=SERVER_HOST,
         port=SERVER_PORT,
         reload=True,
         log_level="info",
+        loop="uvloop",
+        http="httptools",
+        workers=1,
     )
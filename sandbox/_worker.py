@@ -0,0 +1,98 @@
+# sandbox/_worker.py
+# AdaptLab — long-lived sandbox harness launched by sandbox/executor.py.
+# Speaks a framed pipe protocol (4-byte big-endian length + payload):
+#   frame 1:    student source code (utf-8) — compiled once
+#   frame 2..n: stdin for one test case each; every request gets exactly one
+#               binary reply frame:
+#                   1 byte  error flag (0/1)
+#               + 4 bytes big-endian stderr length
+#               + stderr (utf-8)
+#               + raw stdout bytes
+#               Keeping stdout raw lets the executor compare it against the
+#               expected bytes directly, with no JSON escaping or decode.
+# Runs under `python -I` with no imports beyond the stdlib used below.
+# The executor owns timeouts — on deadline it kills this process outright.
+
+import io
+import struct
+import sys
+
+
+def _read_frame(buf) -> bytes | None:
+    header = buf.read(4)
+    if len(header) < 4:
+        return None
+    (length,) = struct.unpack(">I", header)
+    payload = buf.read(length)
+    if len(payload) < length:
+        return None
+    return payload
+
+
+def _write_frame(buf, payload: bytes) -> None:
+    buf.write(struct.pack(">I", len(payload)))
+    buf.write(payload)
+    buf.flush()
+
+
+def _write_reply(buf, stdout_b: bytes, stderr: str, error: bool) -> None:
+    stderr_b = stderr.encode("utf-8")
+    _write_frame(
+        buf,
+        struct.pack(">BI", 1 if error else 0, len(stderr_b)) + stderr_b + stdout_b,
+    )
+
+
+def main() -> None:
+    stdin_buf  = sys.stdin.buffer
+    stdout_buf = sys.stdout.buffer
+
+    source = _read_frame(stdin_buf)
+    if source is None:
+        return
+
+    # The executor syntax-checks before spawning, so compile errors here are
+    # unexpected — report once and exit rather than serving cases.
+    try:
+        code_obj = compile(source.decode("utf-8"), "<student>", "exec")
+    except SyntaxError as exc:
+        _write_reply(stdout_buf, b"", f"SyntaxError: {exc}", True)
+        return
+
+    real_stdout = sys.stdout
+
+    while True:
+        frame = _read_frame(stdin_buf)
+        if frame is None:
+            break   # executor closed the pipe — shut down
+
+        namespace  = {"__name__": "__main__"}
+        # TextIOWrapper over BytesIO encodes prints straight into the raw
+        # buffer — the reply ships those bytes without building a big str.
+        raw        = io.BytesIO()
+        error      = False
+        error_text = ""
+
+        sys.stdin  = io.StringIO(frame.decode("utf-8"))
+        sys.stdout = io.TextIOWrapper(raw, encoding="utf-8", write_through=True)
+        try:
+            exec(code_obj, namespace)
+        except SystemExit as exc:
+            if exc.code not in (None, 0):
+                error      = True
+                error_text = f"SystemExit: {exc.code}"
+        except BaseException as exc:
+            error      = True
+            error_text = f"{type(exc).__name__}: {exc}"
+        finally:
+            # Read the bytes before restoring stdout — dropping the wrapper's
+            # last reference closes the underlying BytesIO.
+            sys.stdout.flush()
+            out_b = raw.getvalue()
+            sys.stdout = real_stdout
+
+        _write_reply(stdout_buf, out_b, error_text, error)
+
+
+if __name__ == "__main__":
+    main()
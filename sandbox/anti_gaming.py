@@ -2,11 +2,13 @@
 # AdaptLab — Hardcoding detection + rapid resubmit detection.
 # Imports from: database/db.py, utils/constants.py, utils/logger.py
 
-import hashlib
-from dataclasses import dataclass
+import heapq
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import NamedTuple, Optional
 
+import xxhash
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from database.models import Submission
@@ -27,26 +29,43 @@ log = get_logger("sandbox.anti_gaming")
 
 # ─────────────────────────────────────────────
 # In-memory cooldown store
-# Maps student_id -> cooldown_expiry (UTC datetime)
+# Maps student_id -> cooldown_expiry as time.time_ns() integers — plain int
+# compares on the per-submit fast path instead of datetime construction.
 # Resets on server restart — acceptable for prototype.
+# A companion min-heap of (expiry_ns, student_id) lets _check_cooldown purge
+# everything expired in one sweep, so memory stays O(active cooldowns)
+# instead of growing with every student ever flagged. Heap entries whose
+# expiry no longer matches the store are stale (the student was re-flagged
+# with a later expiry) and are simply skipped on pop.
 # ─────────────────────────────────────────────
 
-_cooldown_store: dict[str, datetime] = {}
+_NS_PER_SEC = 1_000_000_000
+
+_cooldown_store: dict[str, int] = {}
+_cooldown_heap: list[tuple[int, str]] = []
+
+
+def _purge_expired(now_ns: int) -> None:
+    """Drops every expired cooldown; amortized O(1) per _check_cooldown call."""
+    while _cooldown_heap and _cooldown_heap[0][0] <= now_ns:
+        expiry_ns, sid = heapq.heappop(_cooldown_heap)
+        if _cooldown_store.get(sid) == expiry_ns:
+            del _cooldown_store[sid]
 
 
 # ─────────────────────────────────────────────
 # Output contracts
+# NamedTuples, not dataclasses — these are allocated on every /submit and
+# the C-implemented tuple constructor is the cheapest frozen record we have.
 # ─────────────────────────────────────────────
 
-@dataclass
-class HardcodingResult:
+class HardcodingResult(NamedTuple):
     flagged:            bool
     reason:             Optional[str]       # 'visible_only_pass' | 'suspicious_gap' | None
     capped_score:       Optional[float]     # ANTI_GAME_SCORE_CAP if flagged, else None
 
 
-@dataclass
-class RapidResubmitResult:
+class RapidResubmitResult(NamedTuple):
     flagged:            bool
     reason:             Optional[str]       # 'rapid_resubmit' | None
     cooldown_active:    bool
@@ -77,18 +96,16 @@ def check_hardcoding(
     if hidden_pass_rate is None:
         return HardcodingResult(flagged=False, reason=None, capped_score=None)
 
-    flagged = False
-    reason: Optional[str] = None
-
-    if visible_pass_rate == ANTI_GAME_VISIBLE_FULL and hidden_pass_rate < ANTI_GAME_HIDDEN_THRESH:
-        flagged = True
-        reason = "visible_only_pass"
-
-    elif (visible_pass_rate - hidden_pass_rate) > ANTI_GAME_GAP:
-        flagged = True
-        reason = "suspicious_gap"
+    # Both rules evaluate unconditionally with non-short-circuit bool ops —
+    # one predictable branch on the combined verdict instead of an if/elif
+    # ladder, and the same form batch-vectorizes over arrays if ever needed.
+    rule1 = (visible_pass_rate == ANTI_GAME_VISIBLE_FULL) & (
+        hidden_pass_rate < ANTI_GAME_HIDDEN_THRESH
+    )
+    rule2 = (visible_pass_rate - hidden_pass_rate) > ANTI_GAME_GAP
 
-    if flagged:
+    if rule1 | rule2:
+        reason = "visible_only_pass" if rule1 else "suspicious_gap"
         log.warning(
             "hardcoding_detected",
             reason=reason,
@@ -135,22 +152,25 @@ def check_rapid_resubmit(
         )
         return cooldown_result
 
-    # ── Query recent submissions ───────────────
+    # ── Aggregate recent submissions in SQL ────
+    # COUNT + COUNT(DISTINCT code_hash) inside the engine — the stored
+    # code_hash column means no code blobs are fetched and nothing is
+    # re-hashed in Python per check.
     window_start = datetime.now(timezone.utc) - timedelta(minutes=ANTI_GAME_WINDOW_MIN)
 
-    recent: list[Submission] = (
-        db.query(Submission)
+    submissions_in_window, distinct_stored = (
+        db.query(
+            func.count(Submission.submission_id),
+            func.count(func.distinct(Submission.code_hash)),
+        )
         .filter(
             Submission.student_id == student_id,
             Submission.problem_id == problem_id,
             Submission.submitted_at >= window_start,
         )
-        .order_by(Submission.submitted_at.desc())
-        .all()
+        .one()
     )
 
-    submissions_in_window = len(recent)
-
     if submissions_in_window < ANTI_GAME_SUBMIT_MAX:
         return RapidResubmitResult(
             flagged=False,
@@ -160,9 +180,21 @@ def check_rapid_resubmit(
         )
 
     # ── Count distinct code versions ──────────
-    code_hashes: set[str] = {_hash_code(s.code) for s in recent}
-    code_hashes.add(_hash_code(current_code))
-    distinct_versions = len(code_hashes)
+    # The current (not-yet-persisted) code can add at most one new version;
+    # checking whether its hash already exists in the window avoids pulling
+    # the stored hashes back into Python.
+    current_hash = hash_code(current_code)
+    already_seen = db.query(
+        db.query(Submission.submission_id)
+        .filter(
+            Submission.student_id == student_id,
+            Submission.problem_id == problem_id,
+            Submission.submitted_at >= window_start,
+            Submission.code_hash == current_hash,
+        )
+        .exists()
+    ).scalar()
+    distinct_versions = distinct_stored + (0 if already_seen else 1)
 
     if distinct_versions <= ANTI_GAME_DISTINCT_MIN:
         _apply_cooldown(student_id, seconds=ANTI_GAME_COOLDOWN_S)
@@ -195,15 +227,24 @@ def check_rapid_resubmit(
 
 def _apply_cooldown(student_id: str, seconds: int) -> None:
     """Stores cooldown expiry in the in-memory store."""
-    expiry = datetime.now(timezone.utc) + timedelta(seconds=seconds)
-    _cooldown_store[student_id] = expiry
-    log.info("cooldown_applied", student_id=student_id, expires_at=expiry.isoformat())
+    expiry_ns = time.time_ns() + seconds * _NS_PER_SEC
+    _cooldown_store[student_id] = expiry_ns
+    heapq.heappush(_cooldown_heap, (expiry_ns, student_id))
+    log.info(
+        "cooldown_applied",
+        student_id=student_id,
+        expires_at=datetime.fromtimestamp(expiry_ns / 1e9, tz=timezone.utc).isoformat(),
+    )
 
 
 def _check_cooldown(student_id: str) -> RapidResubmitResult:
     """Returns a flagged result if the student is still within their cooldown window."""
-    expiry = _cooldown_store.get(student_id)
-    if expiry is None:
+    now_ns = time.time_ns()
+    _purge_expired(now_ns)
+
+    # Post-purge, any entry left in the store is still active.
+    expiry_ns = _cooldown_store.get(student_id)
+    if expiry_ns is None:
         return RapidResubmitResult(
             flagged=False,
             reason=None,
@@ -211,23 +252,12 @@ def _check_cooldown(student_id: str) -> RapidResubmitResult:
             cooldown_seconds_remaining=0,
         )
 
-    now = datetime.now(timezone.utc)
-    if now < expiry:
-        remaining = int((expiry - now).total_seconds())
-        return RapidResubmitResult(
-            flagged=True,
-            reason="rapid_resubmit",
-            cooldown_active=True,
-            cooldown_seconds_remaining=remaining,
-        )
-
-    # Cooldown expired — purge it
-    del _cooldown_store[student_id]
+    remaining = (expiry_ns - now_ns) // _NS_PER_SEC
     return RapidResubmitResult(
-        flagged=False,
-        reason=None,
-        cooldown_active=False,
-        cooldown_seconds_remaining=0,
+        flagged=True,
+        reason="rapid_resubmit",
+        cooldown_active=True,
+        cooldown_seconds_remaining=remaining,
     )
 
 
@@ -241,22 +271,38 @@ def is_on_cooldown(student_id: str) -> bool:
 # 4. Utility
 # ─────────────────────────────────────────────
 
-def _hash_code(code: str) -> str:
+# One submit hashes the same code twice (rapid-resubmit check, then the
+# Submission.code_hash stamp) and spam resubmits repeat it across requests —
+# a small memo turns every repeat into a dict hit. Cleared when full; keys
+# are interned request strings, so 512 entries stay a few hundred KB at most.
+_hash_memo: dict[str, str] = {}
+_HASH_MEMO_MAX = 512
+
+
+def hash_code(code: str) -> str:
     """
-    Returns a stable SHA-256 hash of normalised code.
+    Returns a stable xxh3-64 hash of normalised code (16-char hex).
+    The hash is only an equality key for resubmit dedup — never a security
+    boundary — so a fast non-cryptographic hash beats SHA-256 here.
     Strips leading/trailing whitespace before hashing so that
     purely whitespace-padded resubmits are treated as identical.
+    Public — routes_submit.py uses it to stamp Submission.code_hash.
     """
-    normalised = code.strip()
-    return hashlib.sha256(normalised.encode("utf-8")).hexdigest()
+    memoised = _hash_memo.get(code)
+    if memoised is not None:
+        return memoised
+    digest = xxhash.xxh3_64_hexdigest(code.strip().encode("utf-8"))
+    if len(_hash_memo) >= _HASH_MEMO_MAX:
+        _hash_memo.clear()
+    _hash_memo[code] = digest
+    return digest
 
 
 # ─────────────────────────────────────────────
 # 5. Unified interface (used by routes_submit.py)
 # ─────────────────────────────────────────────
 
-@dataclass
-class AntiGamingResult:
+class AntiGamingResult(NamedTuple):
     """Combined anti-gaming result wrapping both hardcoding + rapid resubmit."""
     flagged:                    bool
     reason:                     Optional[str]   # 'visible_only_pass' | 'suspicious_gap' | 'rapid_resubmit' | None
@@ -266,48 +312,42 @@ class AntiGamingResult:
 
 
 def check_anti_gaming(
-    student_id:         str,
-    current_code:       str,
-    db:                 Session,
-    problem_id:         str = "",
-    visible_pass_rate:  Optional[float] = None,
-    hidden_pass_rate:   Optional[float] = None,
+    student_id:   str,
+    current_code: str,
+    db:           Session,
+    problem_id:   str = "",
 ) -> AntiGamingResult:
     """
-    Unified anti-gaming check used by routes_submit.py.
+    Pre-execution anti-gaming check used by routes_submit.py.
+
+    Checks rapid resubmit / cooldown. This is the only anti-gaming entry
+    point that touches the database — all recent-submission state needed
+    per /submit is read in this single pass.
+    """
+    rapid = check_rapid_resubmit(
+        student_id=student_id,
+        problem_id=problem_id,
+        current_code=current_code,
+        db=db,
+    )
+    # Field order matches AntiGamingResult's leading fields — splat the
+    # tuple instead of unpacking it attribute by attribute.
+    return AntiGamingResult(*rapid, None)
 
-    Pre-execution call (visible_pass_rate is None):
-        Checks rapid resubmit only.
 
-    Post-execution call (visible_pass_rate provided):
-        Checks hardcoding detection only.
+def check_anti_gaming_post(
+    visible_pass_rate: float,
+    hidden_pass_rate:  Optional[float],
+) -> AntiGamingResult:
     """
-    # ── Pre-execution: rapid resubmit check ───
-    if visible_pass_rate is None:
-        rapid = check_rapid_resubmit(
-            student_id=student_id,
-            problem_id=problem_id,
-            current_code=current_code,
-            db=db,
-        )
-        return AntiGamingResult(
-            flagged=rapid.flagged,
-            reason=rapid.reason,
-            cooldown_active=rapid.cooldown_active,
-            cooldown_seconds_remaining=rapid.cooldown_seconds_remaining,
-            capped_score=None,
-        )
+    Post-execution anti-gaming check used by routes_submit.py.
 
-    # ── Post-execution: hardcoding check ──────
+    Pure hardcoding analysis over the execution pass rates — no session,
+    no code, no DB round-trip.
+    """
     hc = check_hardcoding(
         visible_pass_rate=visible_pass_rate,
         hidden_pass_rate=hidden_pass_rate,
     )
-    return AntiGamingResult(
-        flagged=hc.flagged,
-        reason=hc.reason,
-        cooldown_active=False,
-        cooldown_seconds_remaining=0,
-        capped_score=hc.capped_score,
-    )
+    return AntiGamingResult(hc.flagged, hc.reason, False, 0, hc.capped_score)
 
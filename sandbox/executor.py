@@ -1,16 +1,30 @@
 # sandbox/executor.py
 # AdaptLab — Runs student code in a subprocess with timeout + memory limits.
+# Student code is compiled once inside a persistent worker (sandbox/_worker.py)
+# and fed test cases over a framed pipe, so a submission pays one interpreter
+# startup regardless of test count.
 # Returns ExecutionResult dataclass. No LLM involved.
 # Imports from: utils/constants.py, utils/logger.py
 
+import hashlib
+import io
 import os
+import platform
+import select
+import struct
 import subprocess
 import sys
-import tempfile
+import threading
 import time
-from dataclasses import dataclass, field
-
-from utils.constants import SANDBOX_MEMORY_MB, SANDBOX_TIMEOUT_SEC
+from collections import OrderedDict
+from functools import lru_cache
+from dataclasses import dataclass, field, replace
+
+from utils.constants import (
+    SANDBOX_MEMORY_MB,
+    SANDBOX_TIMEOUT_SEC,
+    SANDBOX_TRUSTED_INPROCESS,
+)
 from utils.logger import get_logger
 
 log = get_logger("sandbox.executor")
@@ -20,8 +34,10 @@ log = get_logger("sandbox.executor")
 # Output contract
 # ─────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
+    # slots drops the per-instance __dict__ — one of these is allocated per
+    # submission and held in the result cache, so the ~40% size cut compounds.
     compiled:           bool
     passed_visible:     int
     total_visible:      int
@@ -37,23 +53,72 @@ class ExecutionResult:
     visible_results:    list = field(default_factory=list)
     # [{input, expected, got, passed}] — visible only, hidden never included
     test_outputs:       list = field(default_factory=list)
-    # All test case stdout strings in order (visible + hidden)
+    # Test case stdout strings in order; hidden positions hold "" — their
+    # output is never surfaced, so it is not decoded.
     test_results:       list = field(default_factory=list)
     # All test case pass/fail booleans in order (visible + hidden)
 
 
+# ─────────────────────────────────────────────
+# Execution result cache
+# Execution is deterministic for a given (code, test set), so identical
+# resubmits — the classic double submit-button press — are served from
+# memory instead of re-running the sandbox.
+# ─────────────────────────────────────────────
+
+_RESULT_CACHE: OrderedDict[tuple[str, str], ExecutionResult] = OrderedDict()
+_RESULT_CACHE_MAX = 4096
+_result_cache_lock = threading.Lock()
+
+
+def _cache_key(student_code: str, test_cases: list[dict]) -> tuple[str, str]:
+    # usedforsecurity=False skips the FIPS wrapper and lets OpenSSL pick its
+    # fastest backend (SHA-NI on x86) — this is a cache key, not a credential.
+    code_hash  = hashlib.sha256(
+        student_code.strip().encode("utf-8"), usedforsecurity=False
+    ).hexdigest()
+    tests_hash = hashlib.sha256(
+        repr(test_cases).encode("utf-8"), usedforsecurity=False
+    ).hexdigest()
+    return code_hash, tests_hash
+
+
+def _cache_get(key: tuple[str, str]) -> "ExecutionResult | None":
+    with _result_cache_lock:
+        result = _RESULT_CACHE.get(key)
+        if result is not None:
+            _RESULT_CACHE.move_to_end(key)
+    return result
+
+
+def _cache_put(key: tuple[str, str], result: ExecutionResult) -> None:
+    with _result_cache_lock:
+        _RESULT_CACHE[key] = result
+        if len(_RESULT_CACHE) > _RESULT_CACHE_MAX:
+            _RESULT_CACHE.popitem(last=False)
+
+
 # ─────────────────────────────────────────────
 # Memory limiter (Linux only — silently skipped on other OS)
 # ─────────────────────────────────────────────
 
+try:
+    import resource
+except ImportError:          # Windows — no resource module, no preexec_fn
+    resource = None
+
+
+@lru_cache(maxsize=None)
 def _make_preexec(memory_mb: int):
-    """Returns a preexec_fn that sets virtual memory limit via resource module."""
-    import platform
-    if platform.system() == "Windows":
+    """
+    Returns a preexec_fn that sets virtual memory limit via resource module.
+    The closure is pure in memory_mb, so it is built once per limit instead
+    of once per worker spawn.
+    """
+    if platform.system() == "Windows" or resource is None:
         return None   # preexec_fn is not supported on Windows
     def _set_limits():
         try:
-            import resource
             limit_bytes = memory_mb * 1024 * 1024
             resource.setrlimit(resource.RLIMIT_AS, (limit_bytes, limit_bytes))
         except Exception:
@@ -62,44 +127,173 @@ def _make_preexec(memory_mb: int):
 
 
 # ─────────────────────────────────────────────
-# Core execution helper — runs code against ONE test case
+# Persistent worker — one subprocess per run_code call, all test cases
+# executed inside it over a framed pipe (4-byte length + payload).
 # ─────────────────────────────────────────────
 
-def _run_single(
-    code_file: str,
+_WORKER_PATH = os.path.join(os.path.dirname(__file__), "_worker.py")
+
+
+def _spawn_worker(student_code: str, memory_mb: int) -> subprocess.Popen:
+    """Launches the sandbox harness and sends it the student code frame."""
+    popen_kwargs = dict(
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    preexec = _make_preexec(memory_mb)
+    if preexec is not None:
+        popen_kwargs["preexec_fn"] = preexec
+    proc = subprocess.Popen([sys.executable, "-I", _WORKER_PATH], **popen_kwargs)
+    _send_frame(proc, student_code.encode("utf-8"))
+    return proc
+
+
+def _kill_worker(proc: subprocess.Popen) -> None:
+    """Tears down a worker unconditionally; safe to call on a dead process."""
+    try:
+        proc.kill()
+    except OSError:
+        pass
+    try:
+        proc.wait(timeout=1)
+    except Exception:
+        pass
+
+
+def _send_frame(proc: subprocess.Popen, payload: bytes) -> None:
+    proc.stdin.write(struct.pack(">I", len(payload)) + payload)
+    proc.stdin.flush()
+
+
+def _recv_frame(proc: subprocess.Popen, timeout_sec: int) -> tuple[str, bytes]:
+    """
+    Reads one reply frame with a deadline.
+    Returns (status, payload): status is 'ok', 'timeout' (deadline hit —
+    student code still running) or 'eof' (worker died, e.g. memory limit).
+    """
+    deadline    = time.monotonic() + timeout_sec
+    fd          = proc.stdout.fileno()
+    buf         = b""
+    length      = None
+
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return "timeout", b""
+        ready, _, _ = select.select([fd], [], [], remaining)
+        if not ready:
+            return "timeout", b""
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            return "eof", b""
+        buf += chunk
+        if length is None and len(buf) >= 4:
+            (length,) = struct.unpack(">I", buf[:4])
+            buf = buf[4:]
+        if length is not None and len(buf) >= length:
+            # Protocol is strict request/reply, so no trailing bytes exist.
+            return "ok", buf[:length]
+
+
+def _run_case(
+    proc: subprocess.Popen,
     stdin_data: str,
     timeout_sec: int,
-    memory_mb: int,
-) -> tuple[str, str, bool, bool, int]:
+) -> tuple[bytes, str, bool, bool, int, bool]:
     """
-    Returns: (stdout, stderr, timed_out, runtime_error, elapsed_ms)
+    Runs one test case on the worker.
+    Returns: (stdout_bytes, stderr, timed_out, runtime_error, elapsed_ms, worker_alive)
+    stdout stays raw bytes so the caller can memcmp it against the expected
+    output and decode only what actually reaches a student-visible result.
     """
     start = time.monotonic()
     try:
-        preexec = _make_preexec(memory_mb)
-        run_kwargs = dict(
-            input=stdin_data,
-            capture_output=True,
-            text=True,
-            timeout=timeout_sec,
-        )
-        if preexec is not None:
-            run_kwargs["preexec_fn"] = preexec
-        result = subprocess.run(
-            [sys.executable, code_file],
-            **run_kwargs,
-        )
+        _send_frame(proc, stdin_data.encode("utf-8"))
+    except (BrokenPipeError, OSError) as exc:
         elapsed_ms = int((time.monotonic() - start) * 1000)
-        runtime_err = result.returncode != 0
-        return result.stdout, result.stderr, False, runtime_err, elapsed_ms
+        return b"", str(exc), False, True, elapsed_ms, False
 
-    except subprocess.TimeoutExpired:
-        elapsed_ms = int((time.monotonic() - start) * 1000)
-        return "", "TimeoutExpired", True, False, elapsed_ms
+    status, payload = _recv_frame(proc, timeout_sec)
+    elapsed_ms = int((time.monotonic() - start) * 1000)
 
-    except Exception as exc:
-        elapsed_ms = int((time.monotonic() - start) * 1000)
-        return "", str(exc), False, True, elapsed_ms
+    if status == "timeout":
+        return b"", "TimeoutExpired", True, False, elapsed_ms, False
+    if status == "eof":
+        return b"", "worker terminated", False, True, elapsed_ms, False
+
+    # Reply layout: 1-byte error flag + 4-byte stderr length + stderr + stdout.
+    error = bool(payload[0])
+    (stderr_len,) = struct.unpack_from(">I", payload, 1)
+    stderr = payload[5:5 + stderr_len].decode("utf-8", errors="replace")
+    return payload[5 + stderr_len:], stderr, False, error, elapsed_ms, True
+
+
+# ─────────────────────────────────────────────
+# Trusted in-process fast path (SANDBOX_TRUSTED_INPROCESS)
+# Skips the worker subprocess entirely: each case runs on a fresh daemon
+# thread with the std streams swapped. The module lock serializes
+# submissions because the stream swap is process-global.
+# Deliberately NOT a ThreadPoolExecutor: a case stuck in an infinite loop
+# would wedge the pool's only worker — every later submission times out
+# behind it, and the executor's atexit hook joins the stuck thread so the
+# process never exits. A per-case daemon thread is simply abandoned on
+# timeout; the next case gets a live thread and shutdown never blocks.
+# ─────────────────────────────────────────────
+
+_inprocess_lock = threading.Lock()
+
+
+def _exec_inprocess(code_obj, stdin_data: str) -> tuple[bytes, str, bool]:
+    """Runs one case on its case thread. Returns (stdout_bytes, stderr, runtime_error)."""
+    old_stdin, old_stdout = sys.stdin, sys.stdout
+    raw = io.BytesIO()
+    sys.stdin  = io.StringIO(stdin_data)
+    sys.stdout = io.TextIOWrapper(raw, encoding="utf-8", write_through=True)
+    try:
+        exec(code_obj, {"__name__": "__main__"})
+        sys.stdout.flush()
+        return raw.getvalue(), "", False
+    except SystemExit as exc:
+        sys.stdout.flush()
+        if exc.code in (None, 0):
+            return raw.getvalue(), "", False
+        return raw.getvalue(), f"SystemExit: {exc.code}", True
+    except BaseException as exc:
+        sys.stdout.flush()
+        return raw.getvalue(), f"{type(exc).__name__}: {exc}", True
+    finally:
+        sys.stdin, sys.stdout = old_stdin, old_stdout
+
+
+def _run_case_inprocess(
+    code_obj,
+    stdin_data: str,
+    timeout_sec: int,
+) -> tuple[bytes, str, bool, bool, int]:
+    """
+    In-process counterpart of _run_case.
+    Returns: (stdout_bytes, stderr, timed_out, runtime_error, elapsed_ms)
+    A timed-out case cannot be interrupted — its daemon thread is abandoned
+    and keeps running (it may still restore the swapped std streams under a
+    later case), which is the documented trade of the trusted mode.
+    """
+    start = time.monotonic()
+    with _inprocess_lock:
+        result: list[tuple[bytes, str, bool]] = []
+        thread = threading.Thread(
+            target=lambda: result.append(_exec_inprocess(code_obj, stdin_data)),
+            name="sandbox-inproc",
+            daemon=True,
+        )
+        thread.start()
+        thread.join(timeout_sec)
+        if thread.is_alive():
+            elapsed_ms = int((time.monotonic() - start) * 1000)
+            return b"", "TimeoutExpired", True, False, elapsed_ms
+        stdout, stderr, runtime_err = result[0]
+    elapsed_ms = int((time.monotonic() - start) * 1000)
+    return stdout, stderr, False, runtime_err, elapsed_ms
 
 
 # ─────────────────────────────────────────────
@@ -142,19 +336,31 @@ def run_code(
         log.info("syntax_error_detected", error=syntax_err[:200])
         return _zero_result(compiled=False, stderr=syntax_err)
 
-    # ── Step 2: Write code to temp file ───────
-    tmp_file = None
+    # ── Step 2: Result cache lookup ───────────
+    # Identical (code, test set) pairs are deterministic — serve them from
+    # the LRU instead of paying a sandbox run. Hits return a shallow copy
+    # with fresh lists so callers can never mutate the cached entry.
+    cache_key = _cache_key(student_code, test_cases)
+    cached    = _cache_get(cache_key)
+    if cached is not None:
+        log.info("execution_cache_hit", pass_rate=cached.pass_rate)
+        return replace(
+            cached,
+            visible_results=list(cached.visible_results),
+            test_outputs=list(cached.test_outputs),
+            test_results=list(cached.test_results),
+        )
+
+    # ── Step 3: Launch persistent worker ──────
+    # One interpreter startup for the whole submission; the worker compiles
+    # the code once and re-execs it per case. No temp file is written.
+    # In trusted mode there is no worker at all — cases run on an in-process
+    # thread against a code object compiled here.
+    inprocess = SANDBOX_TRUSTED_INPROCESS
+    proc      = None if inprocess else _spawn_worker(student_code, SANDBOX_MEMORY_MB)
+    code_obj  = compile(student_code, "<student>", "exec") if inprocess else None
     try:
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            suffix=".py",
-            delete=False,
-            encoding="utf-8",
-        ) as f:
-            f.write(student_code)
-            tmp_file = f.name
-
-        # ── Step 3: Run each test case ────────
+        # ── Step 4: Run each test case ────────
         passed_visible  = 0
         total_visible   = 0
         passed_hidden   = 0
@@ -169,15 +375,27 @@ def run_code(
 
         for tc in test_cases:
             stdin_data  = str(tc.get("input", ""))
-            expected    = str(tc.get("output", "")).strip()
+            expected_b  = str(tc.get("output", "")).encode("utf-8").strip()
             is_hidden   = bool(tc.get("hidden", False))
 
-            stdout, stderr, tc_timeout, tc_runtime_err, elapsed_ms = _run_single(
-                code_file=tmp_file,
-                stdin_data=stdin_data,
-                timeout_sec=SANDBOX_TIMEOUT_SEC,
-                memory_mb=SANDBOX_MEMORY_MB,
-            )
+            if inprocess:
+                stdout, stderr, tc_timeout, tc_runtime_err, elapsed_ms = _run_case_inprocess(
+                    code_obj=code_obj,
+                    stdin_data=stdin_data,
+                    timeout_sec=SANDBOX_TIMEOUT_SEC,
+                )
+            else:
+                stdout, stderr, tc_timeout, tc_runtime_err, elapsed_ms, alive = _run_case(
+                    proc=proc,
+                    stdin_data=stdin_data,
+                    timeout_sec=SANDBOX_TIMEOUT_SEC,
+                )
+                if not alive:
+                    # Hung or crashed worker — kill it and start a fresh one
+                    # so remaining test cases still run, matching the old
+                    # process-per-case isolation on failure.
+                    _kill_worker(proc)
+                    proc = _spawn_worker(student_code, SANDBOX_MEMORY_MB)
 
             total_elapsed += elapsed_ms
             if tc_timeout:
@@ -187,30 +405,38 @@ def run_code(
             if stderr:
                 last_stderr = stderr
 
-            got     = stdout.strip()
-            passed  = (got == expected) and not tc_timeout and not tc_runtime_err
-
-            # Track ALL test case results in order (visible + hidden)
-            all_test_outputs.append(got if not tc_timeout else "<timeout>")
-            all_test_results.append(passed)
+            # Bytes-level comparison — CPython dispatches == to memcmp, and
+            # no decode or str allocation happens for the pass/fail verdict.
+            got_b   = stdout.strip()
+            passed  = (got_b == expected_b) and not tc_timeout and not tc_runtime_err
 
             if is_hidden:
                 total_hidden += 1
                 if passed:
                     passed_hidden += 1
+                # Hidden stdout is never shown to anyone — keep the slot
+                # without paying for a decode.
+                all_test_outputs.append("")
+                all_test_results.append(passed)
             else:
                 total_visible += 1
                 if passed:
                     passed_visible += 1
+                got = (
+                    got_b.decode("utf-8", errors="replace")
+                    if not tc_timeout else "<timeout>"
+                )
+                all_test_outputs.append(got)
+                all_test_results.append(passed)
                 # Hidden test results are NEVER appended to visible_results
                 visible_results.append({
                     "input":    stdin_data,
-                    "expected": expected,
-                    "got":      got if not tc_timeout else "<timeout>",
+                    "expected": expected_b.decode("utf-8", errors="replace"),
+                    "got":      got,
                     "passed":   passed,
                 })
 
-        # ── Step 4: Compute rates ─────────────
+        # ── Step 5: Compute rates ─────────────
         total_all    = total_visible + total_hidden
         passed_all   = passed_visible + passed_hidden
 
@@ -228,7 +454,7 @@ def run_code(
             elapsed_ms=total_elapsed,
         )
 
-        return ExecutionResult(
+        result = ExecutionResult(
             compiled=True,
             passed_visible=passed_visible,
             total_visible=total_visible,
@@ -245,14 +471,13 @@ def run_code(
             test_outputs=all_test_outputs,
             test_results=all_test_results,
         )
+        _cache_put(cache_key, result)
+        return result
 
     finally:
-        # ── Step 5: Clean up temp file ────────
-        if tmp_file and os.path.exists(tmp_file):
-            try:
-                os.unlink(tmp_file)
-            except OSError:
-                pass
+        # ── Step 6: Tear down the worker ──────
+        if proc is not None:
+            _kill_worker(proc)
 
 
 # ─────────────────────────────────────────────
@@ -5,7 +5,10 @@
 
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Response models are never mutated after construction — see schemas/submission.py.
+_RESPONSE_CONFIG = ConfigDict(frozen=True)
 
 
 # ─────────────────────────────────────────────
@@ -17,6 +20,7 @@ class ConceptScoreSchema(BaseModel):
     One entry in a student's capability profile.
     Maps a single concept to its current EMA score.
     """
+    model_config = _RESPONSE_CONFIG
     concept:    str
     score:      float = Field(..., ge=0.0, le=1.0,
                               description="EMA capability score clamped to [0.0, 1.0]")
@@ -32,6 +36,7 @@ class ZoneSchema(BaseModel):
     Computed learning zone for a concept.
     Mirrors zone thresholds in analysis/question_selector.py.
     """
+    model_config = _RESPONSE_CONFIG
     concept:    str
     score:      float
     zone:       int     # 0=Too Difficult | 1=Easy | 2=Medium (Learning Zone) | 3=Hard
@@ -51,6 +56,7 @@ class CapabilityProfileResponse(BaseModel):
     - Weakest and strongest concepts for at-a-glance diagnostics
     - Overall profile stats (mean score, total concepts seen)
     """
+    model_config = _RESPONSE_CONFIG
     student_id:         str
     student_name:       Optional[str] = None
     total_submissions:  int = 0
@@ -72,6 +78,7 @@ class StudentSummarySchema(BaseModel):
     One student row in the faculty class overview.
     Lightweight snapshot — no full score breakdown.
     """
+    model_config = _RESPONSE_CONFIG
     student_id:         str
     student_name:       Optional[str] = None
     mean_score:         float = Field(default=0.5, ge=0.0, le=1.0)
@@ -92,6 +99,7 @@ class ConceptClassStatsSchema(BaseModel):
     Aggregate stats for one concept across the whole class.
     Used by faculty dashboard to identify class-wide weak spots.
     """
+    model_config = _RESPONSE_CONFIG
     concept:        str
     mean_score:     float = Field(..., ge=0.0, le=1.0)
     min_score:      float = Field(..., ge=0.0, le=1.0)
@@ -117,6 +125,7 @@ class FacultyDashboardResponse(BaseModel):
     - Gaming flag rate
     - Total submissions and active student count
     """
+    model_config = _RESPONSE_CONFIG
     total_students:         int
     active_students:        int     # students with at least 1 submission
     total_submissions:      int
@@ -137,5 +146,6 @@ class ClassOverviewResponse(BaseModel):
 
     Returns a ranked list of all students with their summary stats.
     """
+    model_config = _RESPONSE_CONFIG
     total_students: int
     students:       list[StudentSummarySchema]   # sorted by mean_score ASC (weakest first)
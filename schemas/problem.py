@@ -3,23 +3,43 @@
 # Used by: api/routes_problems.py, api/routes_submit.py, ai/validator.py
 # Imports from: pydantic only.
 
-from typing import Optional
+from typing import Literal, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    field_validator,
+    model_validator,
+)
+from typing_extensions import NotRequired, TypedDict
+
+# Response models are never mutated after construction — see schemas/submission.py.
+_RESPONSE_CONFIG = ConfigDict(frozen=True)
 
 
 # ─────────────────────────────────────────────
 # Shared sub-models
 # ─────────────────────────────────────────────
 
-class TestCaseSchema(BaseModel):
+class TestCaseSchema(TypedDict):
     """
     Single test case as stored in the DB and served to the frontend.
     Hidden test cases are included in execution but NEVER returned to the student.
+    A TypedDict, not a BaseModel — pydantic-core validates it straight into a
+    plain dict, which is what the executor and serializers consume anyway,
+    skipping a model instance per test case.
     """
     input:  str
     output: str
-    hidden: bool = False
+    hidden: NotRequired[bool]   # absent ⇒ visible
+
+
+# Shared adapter for validating a raw test-case list in one pydantic-core
+# call — one Rust-side loop instead of a Python loop of per-dict checks.
+# Built once at import; TypeAdapter construction is not cheap.
+TEST_CASE_LIST_ADAPTER: TypeAdapter[list[TestCaseSchema]] = TypeAdapter(list[TestCaseSchema])
 
 
 class VisibleTestCaseSchema(BaseModel):
@@ -27,6 +47,7 @@ class VisibleTestCaseSchema(BaseModel):
     Visible-only test case — safe to send to student.
     Hidden field stripped entirely to prevent inference.
     """
+    model_config = _RESPONSE_CONFIG
     input:  str
     output: str
 
@@ -55,6 +76,18 @@ class ProblemFullSchema(BaseModel):
     created_by:             str = "faculty"
     validated:              bool = True
     faculty_reviewed:       bool = False
+    # Derived counts — problems are immutable post-validation, so these are
+    # computed once here instead of rescanning test_cases per request.
+    total_test_cases:       int = 0
+    hidden_test_count:      int = 0
+
+    @model_validator(mode="after")
+    def _derive_test_counts(self) -> "ProblemFullSchema":
+        self.total_test_cases  = len(self.test_cases)
+        self.hidden_test_count = sum(
+            tc.get("hidden", False) for tc in self.test_cases
+        )
+        return self
 
 
 # ─────────────────────────────────────────────
@@ -72,6 +105,7 @@ class ProblemStudentSchema(BaseModel):
         GET /problems/{problem_id}
         GET /problems/next
     """
+    model_config = _RESPONSE_CONFIG
     problem_id:             str
     title:                  str
     statement:              str
@@ -83,6 +117,31 @@ class ProblemStudentSchema(BaseModel):
     total_test_cases:       int     # total count including hidden — lets student know how many
     hidden_test_count:      int     # count of hidden tests (number, not content)
 
+    @classmethod
+    def from_full(cls, full: ProblemFullSchema) -> "ProblemStudentSchema":
+        """
+        Strips a full (server-side) problem down to the student-safe view.
+        Both sides are already validated, so this is pure model_construct —
+        one pass over the test cases, no dump/re-validate roundtrip.
+        """
+        visible_cases = [
+            VisibleTestCaseSchema.model_construct(input=tc["input"], output=tc["output"])
+            for tc in full.test_cases
+            if not tc.get("hidden", False)
+        ]
+        return cls.model_construct(
+            problem_id=full.problem_id,
+            title=full.title,
+            statement=full.statement,
+            concept_tags=full.concept_tags,
+            primary_concept=full.primary_concept,
+            difficulty=full.difficulty,
+            expected_complexity=full.expected_complexity,
+            example_cases=visible_cases,
+            total_test_cases=full.total_test_cases,
+            hidden_test_count=full.hidden_test_count,
+        )
+
 
 # ─────────────────────────────────────────────
 # Next problem response
@@ -95,6 +154,7 @@ class NextProblemResponse(BaseModel):
     Returns the problem selected by question_selector for this student,
     along with routing metadata for debugging / faculty inspection.
     """
+    model_config = _RESPONSE_CONFIG
     problem:            ProblemStudentSchema
     selection_mode:     str     # 'zone_based' | 'gaussian'
     band:               int     # -1 if gaussian mode
@@ -112,6 +172,7 @@ class ProblemDetailResponse(BaseModel):
     GET /problems/{problem_id} response body.
     Returns student-safe view of the problem.
     """
+    model_config = _RESPONSE_CONFIG
     problem: ProblemStudentSchema
 
 
@@ -129,7 +190,9 @@ class ProblemCreateRequest(BaseModel):
     statement:              str = Field(..., min_length=20, max_length=5000)
     concept_tags:           list[str] = Field(..., min_length=1)
     primary_concept:        str = Field(..., min_length=1)
-    difficulty:             str = Field(..., pattern=r"^(easy|medium|hard)$")
+    # Literal beats the old ^(easy|medium|hard)$ regex — hash-set membership
+    # in pydantic-core, no regex engine, and an enum in the OpenAPI schema.
+    difficulty:             Literal["easy", "medium", "hard"]
     difficulty_score:       float = Field(..., ge=0.0, le=1.0)
     prerequisite_concepts:  list[str] = []
     test_cases:             list[TestCaseSchema] = Field(..., min_length=2)
@@ -139,7 +202,8 @@ class ProblemCreateRequest(BaseModel):
     @classmethod
     def concept_tags_not_empty_strings(cls, v: list[str]) -> list[str]:
         """Each tag must be a non-empty string."""
-        cleaned = [t.strip() for t in v if t.strip()]
+        # Walrus keeps this a single pass — one strip per tag, not two.
+        cleaned = [s for t in v if (s := t.strip())]
         if not cleaned:
             raise ValueError("concept_tags must contain at least one non-empty tag.")
         return cleaned
@@ -151,9 +215,10 @@ class ProblemCreateRequest(BaseModel):
         Enforces hidden_ratio >= 0.30 at input boundary (spec Section 4.4).
         Rejects faculty-created problems where fewer than 30% of test cases are hidden.
         """
-        if len(v) == 0:
+        if len(v) < 2:
             raise ValueError("At least 2 test cases required.")
-        n_hidden = sum(1 for tc in v if tc.hidden)
+        # bools are ints — summing them directly skips the filter clause.
+        n_hidden = sum(tc.get("hidden", False) for tc in v)
         ratio    = n_hidden / len(v)
         if ratio < 0.30:
             raise ValueError(
@@ -171,6 +236,7 @@ class ProblemCreateResponse(BaseModel):
     """
     Response body after a faculty member creates a new problem.
     """
+    model_config = _RESPONSE_CONFIG
     problem_id:     str
     title:          str
     message:        str = "Problem created and added to the problem bank."
@@ -186,6 +252,7 @@ class ProblemListItem(BaseModel):
     """
     One row in the faculty problem bank listing.
     """
+    model_config = _RESPONSE_CONFIG
     problem_id:         str
     title:              str
     primary_concept:    str
@@ -202,5 +269,6 @@ class ProblemListResponse(BaseModel):
     """
     GET /faculty/problems response body.
     """
+    model_config = _RESPONSE_CONFIG
     total:    int
     problems: list[ProblemListItem]
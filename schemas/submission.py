@@ -3,9 +3,14 @@
 # Single source of truth for all submission API contracts.
 # Imports from: pydantic only.
 
-from typing import Any, Optional
+from typing import Annotated, Any, Literal, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
+
+# Response models are built once and serialised — never mutated. frozen=True
+# lets pydantic generate a core schema without the setattr path; one shared
+# ConfigDict keeps every model pointing at the same object.
+_RESPONSE_CONFIG = ConfigDict(frozen=True)
 
 
 # ─────────────────────────────────────────────
@@ -14,6 +19,7 @@ from pydantic import BaseModel, Field, field_validator
 
 class TestCaseResult(BaseModel):
     """Single visible test case result returned to the frontend."""
+    model_config = _RESPONSE_CONFIG
     input:    str
     expected: str
     got:      str
@@ -22,15 +28,23 @@ class TestCaseResult(BaseModel):
 
 class FeedbackSchema(BaseModel):
     """Brain A structured feedback payload."""
+    model_config = _RESPONSE_CONFIG
+    # Literal, not freeform str — pydantic-core checks membership against a
+    # hash set in Rust, and the contract shows up in the OpenAPI schema.
+    # Values must stay in sync with brain_a's _VALID_MISTAKE_CATEGORIES /
+    # _VALID_DIFFICULTY_SIGNALS sanitisation tables.
     text:               str
-    mistake_category:   str     # off_by_one | missing_base_case | wrong_data_structure |
-                                # brute_force | hardcoded | approach_mismatch |
-                                # syntax | logic | unknown
-    difficulty_signal:  str     # easier | same | harder
+    mistake_category:   Literal[
+        "off_by_one", "missing_base_case", "wrong_data_structure",
+        "brute_force", "hardcoded", "approach_mismatch",
+        "syntax", "logic", "unknown",
+    ]
+    difficulty_signal:  Literal["easier", "same", "harder"]
 
 
 class DeepExplanationSchema(BaseModel):
     """Brain B structured deep explanation — present only when escalated."""
+    model_config = _RESPONSE_CONFIG
     explanation:            str
     step_by_step:           list[str]
     alternative_approach:   str
@@ -39,6 +53,7 @@ class DeepExplanationSchema(BaseModel):
 
 class NextProblemSchema(BaseModel):
     """Minimal problem object returned as the next challenge."""
+    model_config = _RESPONSE_CONFIG
     problem_id:     str
     title:          str
     statement:      str
@@ -48,6 +63,7 @@ class NextProblemSchema(BaseModel):
 
 class CapabilityUpdateSchema(BaseModel):
     """Capability score delta for the primary concept — shown to student."""
+    model_config = _RESPONSE_CONFIG
     concept:    str
     old_score:  float
     new_score:  float
@@ -62,32 +78,22 @@ class SubmitRequest(BaseModel):
     POST /submit request body.
     All fields are validated before the pipeline runs.
     """
-    student_id:     str = Field(..., min_length=1, max_length=64,
-                                description="Student identifier")
-    problem_id:     str = Field(..., min_length=1, max_length=64,
-                                description="Problem identifier")
-    code:           str = Field(..., min_length=1, max_length=50_000,
-                                description="Student's submitted Python code")
+    # Constraints live in pydantic-core (Rust) — stripping, length bounds and
+    # the non-blank pattern all run without a Python validator round-trip.
+    student_id:     Annotated[str, StringConstraints(
+                        strip_whitespace=True, min_length=1, max_length=64)] = Field(
+                        ..., description="Student identifier")
+    problem_id:     Annotated[str, StringConstraints(
+                        strip_whitespace=True, min_length=1, max_length=64)] = Field(
+                        ..., description="Problem identifier")
+    # pattern=r"\S" rejects whitespace-only code without stripping it —
+    # submitted code must keep its leading indentation intact.
+    code:           Annotated[str, StringConstraints(
+                        min_length=1, max_length=50_000, pattern=r"\S")] = Field(
+                        ..., description="Student's submitted Python code")
     deep_explain:   bool = Field(default=False,
                                  description="If True, triggers Brain B escalation")
 
-    @field_validator("student_id", "problem_id")
-    @classmethod
-    def no_whitespace_ids(cls, v: str) -> str:
-        """IDs must not contain leading/trailing whitespace."""
-        stripped = v.strip()
-        if not stripped:
-            raise ValueError("ID must be non-empty after stripping whitespace.")
-        return stripped
-
-    @field_validator("code")
-    @classmethod
-    def code_not_blank(cls, v: str) -> str:
-        """Code must contain at least some non-whitespace characters."""
-        if not v.strip():
-            raise ValueError("Submitted code must not be blank.")
-        return v
-
     model_config = {"str_strip_whitespace": False}
 
 
@@ -112,6 +118,7 @@ class SubmitResponse(BaseModel):
         "gaming_flagged":     false
     }
     """
+    model_config = _RESPONSE_CONFIG
     submission_id:      str
     pass_rate:          float = Field(..., ge=0.0, le=1.0)
     visible_results:    list[TestCaseResult]
@@ -131,6 +138,7 @@ class CooldownResponse(BaseModel):
     """
     Returned with HTTP 429 when rapid resubmit cooldown is active.
     """
+    model_config = _RESPONSE_CONFIG
     detail:                     str = "Too many submissions. Please wait before resubmitting."
     cooldown_seconds_remaining: int
 
@@ -141,6 +149,7 @@ class CooldownResponse(BaseModel):
 
 class SubmissionHistoryItem(BaseModel):
     """Single row in a student's submission history."""
+    model_config = _RESPONSE_CONFIG
     submission_id:  str
     problem_id:     str
     problem_title:  Optional[str] = None
@@ -156,6 +165,7 @@ class SubmissionHistoryResponse(BaseModel):
     """
     GET /student/{student_id}/history response.
     """
+    model_config = _RESPONSE_CONFIG
     student_id:     str
     total:          int
     submissions:    list[SubmissionHistoryItem]
@@ -2,6 +2,9 @@
 # AdaptLab — Single source of truth for all magic numbers.
 # No other file defines constants. Import from here only.
 
+import sys
+from types import MappingProxyType
+
 # ─────────────────────────────────────────────
 # EMA CAPABILITY SCORING
 # ─────────────────────────────────────────────
@@ -22,7 +25,17 @@ SUBMISSION_SCORE_TIMEOUT_CRASH: float    = 0.1   # timeout or runtime crash
 # Concept weights per error_type — used to amplify EMA update for relevant concepts.
 # Keys = error_type strings returned by feature_extractor.py
 # Values = dict of {concept: weight} overriding EMA_DEFAULT_WEIGHT
-CONCEPT_WEIGHTS: dict[str, dict[str, float]] = {
+# Keys are interned so per-submission lookups hit the pointer-equality fast
+# path in dict probes; MappingProxyType freezes the tables against accidental
+# mutation by any caller.
+def _freeze(d: dict) -> MappingProxyType:
+    return MappingProxyType({
+        sys.intern(k): (_freeze(v) if isinstance(v, dict) else v)
+        for k, v in d.items()
+    })
+
+
+CONCEPT_WEIGHTS: MappingProxyType = _freeze({
     "off_by_one":            {"loops": 0.20, "arrays": 0.05},
     "missing_base_case":     {"recursion": 0.20, "functions": 0.05},
     "wrong_data_structure":  {"dictionaries": 0.20, "arrays": 0.08},
@@ -32,7 +45,7 @@ CONCEPT_WEIGHTS: dict[str, dict[str, float]] = {
     "approach_mismatch":     {"sorting": 0.15},
     "syntax_error":          {},   # no concept penalty for syntax errors
     "none":                  {},   # use EMA_DEFAULT_WEIGHT for all concepts
-}
+})
 
 # ─────────────────────────────────────────────
 # ZONE THRESHOLDS (prototype routing)
@@ -44,11 +57,11 @@ ZONE_MEDIUM_MAX: float    = 0.75   # score < 0.75  → zone 2 (medium / learning
 # score >= 0.75                    → zone 3 (hard band / approaching mastery)
 
 # Brain A difficulty_signal → band offset
-BAND_OFFSET: dict[str, int] = {
+BAND_OFFSET: MappingProxyType = _freeze({
     "easier": -1,
     "same":    0,
     "harder": +1,
-}
+})
 
 BAND_MIN: int = 0
 BAND_MAX: int = 3
@@ -67,6 +80,13 @@ ESCALATION_LOW_CAP: float   = 0.40  # capability score below this triggers escal
 SANDBOX_TIMEOUT_SEC: int  = 5    # hard timeout per subprocess run
 SANDBOX_MEMORY_MB: int    = 256  # memory limit enforced via resource module (Linux)
 
+# Trusted in-process fast path: executes student code in a thread of the
+# server process instead of the sandbox worker. Skips process isolation and
+# the memory cap, and a timed-out case leaves its abandoned daemon thread
+# spinning until process exit (later cases still get a fresh thread) —
+# only enable for trusted classroom/demo deployments.
+SANDBOX_TRUSTED_INPROCESS: bool = False
+
 # ─────────────────────────────────────────────
 # ANTI-GAMING DETECTION
 # ─────────────────────────────────────────────
@@ -136,7 +156,7 @@ CREATED_BY_BRAIN_B:  str = "brain_b"
 
 # Concept prerequisite map — used by question_selector.py when routing to zone 0.
 # For a given concept, this defines what simpler concept to fall back to.
-CONCEPT_PREREQUISITES: dict[str, str] = {
+CONCEPT_PREREQUISITES: MappingProxyType = _freeze({
     "loops":          "variables",
     "arrays":         "loops",
     "strings":        "loops",
@@ -148,7 +168,15 @@ CONCEPT_PREREQUISITES: dict[str, str] = {
     "graphs":         "arrays",
     "trees":          "recursion",
     "variables":      "variables",   # root concept, no further fallback
-}
+})
+
+# ─────────────────────────────────────────────
+# SCHEMA VERSIONING
+# ─────────────────────────────────────────────
+
+# Stored in the schema_meta sentinel table; bump whenever database/models.py
+# changes so init_db re-runs create_all instead of skipping it.
+SCHEMA_VERSION: str = "1"
 
 # ─────────────────────────────────────────────
 # SERVER CONFIGURATION
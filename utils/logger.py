@@ -2,13 +2,82 @@
 # AdaptLab — Structured JSON logger used by every module.
 # Imports from: nothing (zero internal dependencies by design).
 
+import functools
 import logging
-import json
 import sys
+import time
 import traceback
-from datetime import datetime, timezone
 from typing import Any
 
+# orjson serializes the record dict in C and is the app's default encoder
+# anyway; the stdlib fallback keeps this module dependency-free in spirit —
+# it must never be the reason logging breaks.
+try:
+    import orjson
+
+    def _dumps(obj: dict) -> str:
+        return orjson.dumps(obj, default=str).decode("utf-8")
+except ImportError:
+    import json
+
+    orjson = None
+
+    def _dumps(obj: dict) -> str:
+        return json.dumps(obj, default=str)
+
+# Per-second timestamp cache: records within the same UTC second reuse the
+# strftime prefix and only format the microsecond suffix — the full
+# datetime-plus-isoformat per record is the formatter's dominant cost.
+_TS_CACHE: list = [0, ""]
+
+
+def _format_timestamp(created: float) -> str:
+    sec = int(created)
+    if sec != _TS_CACHE[0]:
+        _TS_CACHE[:] = [sec, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))]
+    return f"{_TS_CACHE[1]}.{int((created - sec) * 1e6):06d}Z"
+
+
+# Stdlib LogRecord attributes (plus "component", injected separately) that
+# must not leak into the structured-fields section of a log line.
+_RESERVED_LOG_FIELDS = frozenset({
+    "name", "msg", "args", "levelname", "levelno", "pathname",
+    "filename", "module", "exc_info", "exc_text", "stack_info",
+    "lineno", "funcName", "created", "msecs", "relativeCreated",
+    "thread", "threadName", "processName", "process", "message",
+    "component",
+})
+
+
+# Shared by the str formatter and the bytes handler below.
+_EXC_FORMATTER = logging.Formatter()
+
+
+def _build_log_obj(record: logging.LogRecord) -> dict[str, Any]:
+    """Builds the structured log dict for a record — serializer-agnostic."""
+    log_obj: dict[str, Any] = {
+        "timestamp": _format_timestamp(record.created),
+        "level":     record.levelname,
+        "component": getattr(record, "component", record.name),
+        "event":     record.getMessage(),
+    }
+
+    # Attach any extra structured fields passed via `extra=` —
+    # comprehension + one C-level dict merge instead of per-key setitem.
+    log_obj |= {
+        k: v
+        for k, v in record.__dict__.items()
+        if k not in _RESERVED_LOG_FIELDS
+    }
+
+    # Attach exception info if present
+    if record.exc_info:
+        log_obj["exception"] = _EXC_FORMATTER.formatException(record.exc_info)
+    elif record.exc_text:
+        log_obj["exception"] = record.exc_text
+
+    return log_obj
+
 
 class JSONFormatter(logging.Formatter):
     """
@@ -17,38 +86,48 @@ class JSONFormatter(logging.Formatter):
     """
 
     def format(self, record: logging.LogRecord) -> str:
-        log_obj: dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "level":     record.levelname,
-            "component": getattr(record, "component", record.name),
-            "event":     record.getMessage(),
-        }
-
-        # Attach any extra structured fields passed via `extra=`
-        reserved = {
-            "name", "msg", "args", "levelname", "levelno", "pathname",
-            "filename", "module", "exc_info", "exc_text", "stack_info",
-            "lineno", "funcName", "created", "msecs", "relativeCreated",
-            "thread", "threadName", "processName", "process", "message",
-            "component",
-        }
-        for key, value in record.__dict__.items():
-            if key not in reserved:
-                log_obj[key] = value
-
-        # Attach exception info if present
-        if record.exc_info:
-            log_obj["exception"] = self.formatException(record.exc_info)
-        elif record.exc_text:
-            log_obj["exception"] = record.exc_text
-
-        return json.dumps(log_obj, default=str)
+        return _dumps(_build_log_obj(record))
 
 
+class BytesJSONHandler(logging.StreamHandler):
+    """
+    StreamHandler that writes orjson's native bytes straight to the
+    stream's binary buffer — skips the str round-trip through a Formatter
+    plus the TextIOWrapper re-encode on every record.
+    Only registered when orjson is importable.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            payload = orjson.dumps(_build_log_obj(record), default=str)
+            buffer  = getattr(self.stream, "buffer", None)
+            if buffer is not None:
+                buffer.write(payload + b"\n")
+                buffer.flush()
+            else:
+                # Stream was swapped for a text-only object (tests, capture)
+                # — fall back to the text interface.
+                self.stream.write(payload.decode("utf-8") + "\n")
+                self.stream.flush()
+        except Exception:
+            self.handleError(record)
+
+
+def _make_handler() -> logging.Handler:
+    """Bytes fast path when orjson is present, str formatter otherwise."""
+    if orjson is not None:
+        return BytesJSONHandler(sys.stdout)
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(JSONFormatter())
+    return handler
+
+
+@functools.lru_cache(maxsize=None)
 def get_logger(component: str) -> "AdaptLabLogger":
     """
     Factory function. Every module calls get_logger(__name__) or
-    get_logger("component_name") to obtain its logger.
+    get_logger("component_name") to obtain its logger. Cached — repeat
+    calls for the same component return the same wrapper instance.
 
     Usage:
         from utils.logger import get_logger
@@ -58,6 +137,17 @@ def get_logger(component: str) -> "AdaptLabLogger":
     return AdaptLabLogger(component)
 
 
+# One handler serves every component logger; children of "adaptlab"
+# propagate here and stop (propagate=False keeps records off the root
+# logger, matching the old per-component behavior).
+_SHARED_HANDLER = _make_handler()
+
+_BASE_LOGGER = logging.getLogger("adaptlab")
+_BASE_LOGGER.addHandler(_SHARED_HANDLER)
+_BASE_LOGGER.setLevel(logging.DEBUG)
+_BASE_LOGGER.propagate = False
+
+
 class AdaptLabLogger:
     """
     Thin wrapper around stdlib Logger that:
@@ -67,35 +157,43 @@ class AdaptLabLogger:
     - Accepts arbitrary kwargs as structured fields
     """
 
+    # Slot descriptors beat a per-instance __dict__ — one wrapper exists per
+    # component (get_logger is cached) but every log call reads _logger.
+    __slots__ = ("component", "_logger")
+
     def __init__(self, component: str) -> None:
         self.component = component
-        self._logger = logging.getLogger(f"adaptlab.{component}")
-
-        if not self._logger.handlers:
-            handler = logging.StreamHandler(sys.stdout)
-            handler.setFormatter(JSONFormatter())
-            self._logger.addHandler(handler)
-            self._logger.setLevel(logging.DEBUG)
-            self._logger.propagate = False
+        # Component loggers carry no handlers of their own — records
+        # propagate to the shared "adaptlab" parent handler configured below.
+        self._logger = _BASE_LOGGER.getChild(component)
 
     def _make_extra(self, kwargs: dict[str, Any]) -> dict[str, Any]:
         kwargs["component"] = self.component
         return kwargs
 
+    # Each level method checks isEnabledFor before touching kwargs — a
+    # filtered-out record costs one C-level level compare instead of the
+    # extra-dict build plus the stdlib's own handle machinery.
+
     def info(self, event: str, **kwargs: Any) -> None:
-        self._logger.info(event, extra=self._make_extra(kwargs))
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(event, extra=self._make_extra(kwargs))
 
     def debug(self, event: str, **kwargs: Any) -> None:
-        self._logger.debug(event, extra=self._make_extra(kwargs))
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(event, extra=self._make_extra(kwargs))
 
     def warning(self, event: str, **kwargs: Any) -> None:
-        self._logger.warning(event, extra=self._make_extra(kwargs))
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._logger.warning(event, extra=self._make_extra(kwargs))
 
     def error(self, event: str, **kwargs: Any) -> None:
-        self._logger.error(event, extra=self._make_extra(kwargs))
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._logger.error(event, extra=self._make_extra(kwargs))
 
     def critical(self, event: str, **kwargs: Any) -> None:
-        self._logger.critical(event, extra=self._make_extra(kwargs))
+        if self._logger.isEnabledFor(logging.CRITICAL):
+            self._logger.critical(event, extra=self._make_extra(kwargs))
 
     def exception(self, event: str, **kwargs: Any) -> None:
         """Logs ERROR level with full traceback attached automatically."""
@@ -106,9 +204,9 @@ class AdaptLabLogger:
 
 # ─────────────────────────────────────────────
 # Module-level root logger for one-off use
+# Handler + formatter are only allocated if the root logger has none —
+# no dead StreamHandler/JSONFormatter pair when another is already attached.
 # ─────────────────────────────────────────────
-_root_handler = logging.StreamHandler(sys.stdout)
-_root_handler.setFormatter(JSONFormatter())
-logging.root.setLevel(logging.DEBUG)
 if not logging.root.handlers:
-    logging.root.addHandler(_root_handler)
+    logging.root.addHandler(_make_handler())
+    logging.root.setLevel(logging.DEBUG)